@@ -1,16 +1,18 @@
 import os
 from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
-from lib.log_viewer import LogViewer
+from lib.log_viewer import LogViewer, SAMPLE_RANDOM
 
 DEFAULT_NUM_LINES = 10000
 MAX_NUM_LINES = 10000000
 LOG_DIR = '/var/log'
 CHUNK_SIZE = MAX_NUM_LINES // 100
 """ sending CHUNK_SIZE amount of lines for the streaming option """
+STATS_HEADERS = ['X-Bytes-Scanned', 'X-Estimated-Matches', 'X-Complete']
+""" headers reporting the scan statistics of a non-streaming response """
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=STATS_HEADERS)
 
 @app.route('/<filename>', methods=['GET'])
 def get_log(filename):
@@ -26,16 +28,35 @@ def get_log(filename):
     keyword = request.args.get('keyword', '')
     n = request.args.get('n', str(DEFAULT_NUM_LINES))
     stream = request.args.get('stream', 'false').lower() == 'true'
+    sample = request.args.get('sample', '')
+    budget_ms = request.args.get('budget_ms', '')
+    budget_bytes = request.args.get('budget_bytes', '')
 
     if not n.isdigit():
         return jsonify({'error': 'Number of lines must be a valid number'}), 400
 
+    if sample == '':
+        sample = None
+    elif sample.isdecimal() and int(sample) > 0:
+        sample = int(sample)
+    elif sample != SAMPLE_RANDOM:
+        return jsonify({'error': f'Sample must be a positive number or {SAMPLE_RANDOM}'}), 400
+
+    if budget_ms != '' and not (budget_ms.isdecimal() and int(budget_ms) > 0):
+        return jsonify({'error': 'Time budget (budget_ms) must be a positive number'}), 400
+
+    if budget_bytes != '' and not (budget_bytes.isdecimal() and int(budget_bytes) > 0):
+        return jsonify({'error': 'Byte budget (budget_bytes) must be a positive number'}), 400
+
     n = int(n)
     if n > MAX_NUM_LINES:
         n = MAX_NUM_LINES
 
     file_path = os.path.join(LOG_DIR, filename)
-    log_viewer = LogViewer(filename, file_path, keyword, n)
+    log_viewer = LogViewer(filename, file_path, keyword, n,
+                           sample=sample,
+                           budget_ms=int(budget_ms) if budget_ms != '' else None,
+                           budget_bytes=int(budget_bytes) if budget_bytes != '' else None)
 
     if not log_viewer.is_valid_filename():
         return jsonify({'error': 'Invalid filename format'}), 400
@@ -51,7 +72,7 @@ def get_log(filename):
             def generate():
                 chunk = []
                 for line in log_viewer.get_lines_generator():
-                    chunk.append(f"{line.strip()}\n")
+                    chunk.append(f"{line}\n")
                     if len(chunk) >= CHUNK_SIZE:
                         yield ''.join(chunk)
                         chunk = []
@@ -60,7 +81,13 @@ def get_log(filename):
             return Response(generate(), content_type='text/plain')
         else:
             lines = log_viewer.get_lines()
-            return Response(''.join(lines), content_type='text/plain')
+            stats = log_viewer.get_stats()
+            headers = {
+                'X-Bytes-Scanned': str(stats['bytes_scanned']),
+                'X-Estimated-Matches': 'unknown' if stats['estimated_matches'] is None else str(stats['estimated_matches']),
+                'X-Complete': str(stats['complete']).lower()
+            }
+            return Response(''.join(lines), content_type='text/plain', headers=headers)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -80,7 +107,10 @@ def index():
                 "filename": "The name of the log file (required)",
                 "keyword": "Text/keyword to filter log lines (optional, default: any text/keyword)",
                 "n": f"Number of matching entries to return (optional, default: {DEFAULT_NUM_LINES} lines)",
-                "stream": "Whether to stream the response (optional, default: false)"
+                "stream": "Whether to stream the response (optional, default: false)",
+                "sample": f"Return every k-th matching entry, or a uniform random sample with '{SAMPLE_RANDOM}' (optional, default: every entry)",
+                "budget_ms": "Time limit in milliseconds for scanning the file, the best result found so far is returned (optional, default: no limit)",
+                "budget_bytes": "Limit of bytes scanned from the file, the best result found so far is returned (optional, default: no limit)"
             },
             "example": f"/test.log?keyword=error&n=50&stream=true"
         }
@@ -105,7 +135,10 @@ def page_not_found(e):
                 "filename": "The name of the log file (required)",
                 "keyword": "Text/keyword to filter log lines (optional, default: any text/keyword)",
                 "n": f"Number of matching entries to return (optional, default: {DEFAULT_NUM_LINES} lines)",
-                "stream": "Whether to stream the response (optional, default: false)"
+                "stream": "Whether to stream the response (optional, default: false)",
+                "sample": f"Return every k-th matching entry, or a uniform random sample with '{SAMPLE_RANDOM}' (optional, default: every entry)",
+                "budget_ms": "Time limit in milliseconds for scanning the file, the best result found so far is returned (optional, default: no limit)",
+                "budget_bytes": "Limit of bytes scanned from the file, the best result found so far is returned (optional, default: no limit)"
             },
             "example": f"/test.log?keyword=error&n=50&stream=true"
         }
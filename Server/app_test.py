@@ -7,6 +7,7 @@ import time
 log_dir = '/var/log'
 test_file_path = os.path.join(log_dir, 'test.log')
 large_test_file_path = os.path.join(log_dir, 'large_test.log')
+crlf_test_file_path = os.path.join(log_dir, 'crlf_test.log')
 
 @pytest.fixture(scope='module', autouse=True)
 def setup_and_teardown():
@@ -29,12 +30,17 @@ def setup_and_teardown():
         for i in range(1, 1000001):
             f.write(f'Line {i}\n')
 
+    with open(crlf_test_file_path, 'wb') as f:
+        f.write(b'  Line 1 \r\nLine 2\t\r\nLine 3\r\n')
+
     yield
 
     if os.path.exists(test_file_path):
         os.remove(test_file_path)
     if os.path.exists(large_test_file_path):
         os.remove(large_test_file_path)
+    if os.path.exists(crlf_test_file_path):
+        os.remove(crlf_test_file_path)
 
 def append_logs(file_path, stop_event):
     """
@@ -359,3 +365,132 @@ def test_read_large_file_stream_append():
     finally:
         stop_event.set()
         append_thread.join()
+
+def test_crlf_and_whitespace():
+    """
+    Test to verify that CRLF line terminators are removed while leading and trailing whitespace is kept.
+    
+    Steps:
+    1. Send a GET request to the CRLF log file with and without streaming enabled.
+    
+    Assertions:
+    - Response status code should be 200.
+    - Both responses should contain the same lines in reverse order, without carriage returns.
+    """
+    for stream in ('false', 'true'):
+        response = requests.get(f'http://localhost:5000/crlf_test.log?stream={stream}')
+        assert response.status_code == 200
+        assert response.text.split('\n') == ['Line 3', 'Line 2\t', '  Line 1 ', '']
+
+def test_invalid_sample_and_budget():
+    """
+    Test to verify that requesting a log file with an invalid sample or budget returns a 400 error.
+    
+    Steps:
+    1. Send GET requests with an invalid sample, an invalid time budget and an invalid byte budget.
+    
+    Assertions:
+    - Response status code should be 400.
+    - Response JSON should contain the sample and budget errors, naming the invalid parameter.
+    """
+    response = requests.get('http://localhost:5000/test.log?sample=0')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'Sample must be a positive number or random'
+    response = requests.get('http://localhost:5000/test.log?budget_ms=invalid')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'Time budget (budget_ms) must be a positive number'
+    response = requests.get('http://localhost:5000/test.log?budget_ms=0')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'Time budget (budget_ms) must be a positive number'
+    response = requests.get('http://localhost:5000/test.log?budget_bytes=0')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'Byte budget (budget_bytes) must be a positive number'
+    response = requests.get('http://localhost:5000/test.log?budget_ms=%C2%B2')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'Time budget (budget_ms) must be a positive number'
+    response = requests.get('http://localhost:5000/test.log?sample=%C2%B2')
+    assert response.status_code == 400
+    assert response.json()['error'] == 'Sample must be a positive number or random'
+
+def test_sample_every_kth():
+    """
+    Test to verify that sampling every k-th match returns the correct content and scan statistics.
+    
+    Steps:
+    1. Send a GET request to the log file with sample=3.
+    
+    Assertions:
+    - Response status code should be 200.
+    - Response text should contain every third line in reverse order.
+    - Headers should report a complete scan of the whole file with the exact number of matches.
+    """
+    response = requests.get('http://localhost:5000/test.log?sample=3')
+    assert response.status_code == 200
+    lines = response.text.strip().split('\n')
+    assert lines == ['Line 11', 'Line 8', 'Line 5', 'Line 2']
+    assert response.headers['X-Bytes-Scanned'] == str(os.path.getsize(test_file_path))
+    assert response.headers['X-Estimated-Matches'] == '11'
+    assert response.headers['X-Complete'] == 'true'
+
+def test_sample_random():
+    """
+    Test to verify that a random sample returns distinct matching lines.
+    
+    Steps:
+    1. Send a GET request to the large log file with sample=random and a keyword.
+    
+    Assertions:
+    - Response status code should be 200.
+    - Response text should contain the requested number of distinct lines matching the keyword.
+    - Headers should report a complete result.
+    """
+    response = requests.get('http://localhost:5000/large_test.log?keyword=Line 9&n=50&sample=random')
+    assert response.status_code == 200
+    lines = response.text.strip().split('\n')
+    assert len(lines) == 50
+    assert len(set(lines)) == 50
+    assert all('Line 9' in line for line in lines)
+    assert response.headers['X-Complete'] == 'true'
+
+def test_budget_bytes():
+    """
+    Test to verify that a byte budget returns the best partial result with its scan statistics.
+    
+    Steps:
+    1. Send a GET request to the large log file for every line with a budget of 100000 bytes.
+    
+    Assertions:
+    - Response status code should be 200.
+    - Response text should contain only the newest lines.
+    - Headers should report the bytes scanned, an estimate of all lines and an incomplete result.
+    """
+    response = requests.get('http://localhost:5000/large_test.log?n=10000000&budget_bytes=100000')
+    assert response.status_code == 200
+    lines = response.text.strip().split('\n')
+    assert 0 < len(lines) < 100000 // 10
+    assert response.headers['X-Bytes-Scanned'] == '100000'
+    assert 900000 < int(response.headers['X-Estimated-Matches']) < 1100000
+    assert response.headers['X-Complete'] == 'false'
+
+def test_scan_statistics():
+    """
+    Test to verify that the scan statistics report the bytes actually read and agree between sampling modes.
+    
+    Steps:
+    1. Send a GET request to the small log file for a single line.
+    2. Send GET requests for zero lines with and without random sampling.
+    
+    Assertions:
+    - X-Bytes-Scanned should be the whole small file (read in one go) with the matches extrapolated from the consumed lines.
+    - An empty result should be complete for both sampling modes, with an unknown number of matches.
+    """
+    response = requests.get('http://localhost:5000/test.log?n=1')
+    assert response.status_code == 200
+    assert response.text == 'Line 11\n'
+    assert response.headers['X-Bytes-Scanned'] == str(os.path.getsize(test_file_path))
+    assert response.headers['X-Complete'] == 'true'
+    for sample in ('', 'random'):
+        response = requests.get(f'http://localhost:5000/test.log?n=0&sample={sample}')
+        assert response.status_code == 200
+        assert response.headers['X-Complete'] == 'true'
+        assert response.headers['X-Estimated-Matches'] == 'unknown'
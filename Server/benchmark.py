@@ -0,0 +1,97 @@
+import os
+import sys
+import tempfile
+import time
+from lib.reverse_reader import ReverseLineReader
+
+# Constants
+NUM_LINES = 2000000
+""" NUM_LINES is the number of lines written to the benchmark log file """
+KEYWORD = 'ERROR'
+LEGACY_BUFFER_SIZE = 500 * 1024  # 500 KB
+""" LEGACY_BUFFER_SIZE is the BUFFER_SIZE used by the legacy large file generator """
+
+def legacy_reverse_lines(path, keyword):
+    """
+    Frozen copy of the former LogViewer large file generator, kept as the baseline of the benchmark.
+
+    Args:
+    - path (str): Path to the log file.
+    - keyword (str): The keyword to filter log lines.
+
+    Yields:
+    - str: The filtered log lines.
+    """
+    with open(path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        buffer = b''
+        position = file.tell()
+
+        while position > 0:
+            position = max(0, position - LEGACY_BUFFER_SIZE)
+            file.seek(position)
+            buffer = file.read(LEGACY_BUFFER_SIZE) + buffer
+            cur_lines = buffer.split(b'\n')
+            buffer = cur_lines.pop(0)  # Keep the last partial line for the next read
+
+            for line in reversed(cur_lines):
+                if len(line) > 0 and keyword.encode() in line:
+                    yield line.decode().strip()
+
+class Benchmark:
+    def __init__(self, num_lines, keyword):
+        """
+        Initialize the Benchmark instance.
+
+        Args:
+        - num_lines (int): Number of lines in the generated log file.
+        - keyword (str): The keyword used to filter log lines.
+        """
+        self.__num_lines = num_lines
+        self.__keyword = keyword
+
+    def __create_log_file(self, file_path):
+        """
+        Write a log file with alternating INFO and ERROR lines.
+
+        Args:
+        - file_path (str): Path to the log file.
+        """
+        with open(file_path, 'w') as file:
+            for i in range(self.__num_lines):
+                level = 'ERROR' if i % 2 else 'INFO'
+                file.write(f'{level} 2024-12-26 18:30:00 Line {i}\n')
+
+    def __measure(self, name, lines):
+        """
+        Consume an iterable of lines and print the throughput.
+
+        Args:
+        - name (str): Label printed with the result.
+        - lines (iterable): The lines to consume.
+        """
+        start = time.perf_counter()
+        count = 0
+        for _ in lines:
+            count += 1
+        elapsed = time.perf_counter() - start
+        print(f"{name:<32} {count:>10} lines {elapsed:>8.3f} s {count / elapsed:>14,.0f} lines/s")
+
+    def run(self):
+        """
+        Compare the legacy large file generator with ReverseLineReader on the same file.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'benchmark.log')
+            self.__create_log_file(file_path)
+            keyword = self.__keyword.encode()
+
+            self.__measure('Legacy large file generator', legacy_reverse_lines(file_path, self.__keyword))
+            self.__measure('ReverseLineReader', ReverseLineReader(file_path, predicate=lambda line: keyword in line))
+
+def main():
+    num_lines = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_LINES
+    Benchmark(num_lines, KEYWORD).run()
+
+if __name__ == "__main__":
+    main()
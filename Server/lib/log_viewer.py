@@ -1,16 +1,25 @@
 import os
+import random
 import re
+import time
 from collections import deque
+from lib.reverse_reader import ReverseLineReader, PARTIAL_LINE_INCLUDE
 
 # Constants
 SMALL_FILE_SIZE_LIMIT = 5 * 1024 * 1024  # 5 MB
 """ SMALL_FILE_SIZE_LIMIT (5MB default) is the size to determine if file is small enough to load into memory """
 BUFFER_SIZE = 500 * 1024  # 500 KB
-""" BUFFER_SIZE (500KB default) is the size """
+""" BUFFER_SIZE (500KB default) is the size of each chunk read from a large file """
+MAX_LINE_LENGTH = 1024 * 1024  # 1 MB
+""" MAX_LINE_LENGTH (1MB default) is the size longer lines are truncated to """
+PARTIAL_LINE = PARTIAL_LINE_INCLUDE
+""" PARTIAL_LINE (include default) is the policy for a final line that is still being written, see lib.reverse_reader """
+SAMPLE_RANDOM = 'random'
+""" SAMPLE_RANDOM selects a uniform random sample of the matching lines instead of every k-th one """
 
 
 class LogViewer:
-    def __init__(self, filename, filepath, keyword, num_lines):
+    def __init__(self, filename, filepath, keyword, num_lines, sample=None, budget_ms=None, budget_bytes=None):
         """
         Initialize the LogViewer instance.
 
@@ -19,12 +28,19 @@ class LogViewer:
         - filepath (str): The path to the log file.
         - keyword (str): The keyword to filter log lines.
         - num_lines (int): The number of log lines to retrieve.
+        - sample (int | str): Return every k-th matching line, or a uniform random sample of them with SAMPLE_RANDOM (optional, default: every matching line).
+        - budget_ms (int): Stop scanning the file after this many milliseconds and return the lines found so far (optional, default: no limit).
+        - budget_bytes (int): Stop scanning the file after this many bytes and return the lines found so far (optional, default: no limit).
         """
         self.__file_name = filename
         self.__file_path = filepath
         self.__keyword = keyword
         self.__num_lines = num_lines
+        self.__sample = sample
+        self.__budget_ms = budget_ms
+        self.__budget_bytes = budget_bytes
         self.__lines = deque(maxlen=num_lines)
+        self.__stats = {'bytes_scanned': 0, 'estimated_matches': 0, 'complete': False}
 
     def is_valid_filename(self):
         """
@@ -44,107 +60,129 @@ class LogViewer:
         """
         return re.match(r'^[\w\s-]*$', self.__keyword) is not None
 
-    def __read_small_file(self):
+    def __read_lines_generator(self, buffer_size):
         """
-        Read a small log file (one time in memory) and filter lines based on the keyword.
-        """
-        with open(self.__file_path, 'r') as file:
-            read_lines = file.readlines()
-            if self.__keyword == '':
-                self.__lines.extend(read_lines[-1:-(self.__num_lines+1):-1])
-            else:
-                cntr = 0
-                for line in reversed(read_lines):
-                    if cntr == self.__num_lines:
-                        break
-                    if self.__keyword in line:
-                        self.__lines.append(line)
-                        cntr += 1
+        Generator to read the log file backwards (buffer_size bytes at a time) and filter lines based on the keyword.
 
-    def __read_small_file_generator(self):
-        """
-        Generator (used for streaming) to read a small log file and filter lines based on the keyword.
+        Args:
+        - buffer_size (int): Number of bytes loaded into memory per read.
 
         Yields:
-        - str: The filtered log lines.
+        - str: The filtered log lines (without line terminator).
+        """
+        keyword = self.__keyword.encode()
+        deadline = None
+        if self.__budget_ms is not None:
+            deadline = time.monotonic() + self.__budget_ms / 1000
+        reader = ReverseLineReader(self.__file_path,
+                                   predicate=(lambda line: keyword in line) if keyword else None,
+                                   buffer_size=buffer_size,
+                                   max_line_length=MAX_LINE_LENGTH,
+                                   partial_line=PARTIAL_LINE,
+                                   max_bytes=self.__budget_bytes,
+                                   deadline=deadline)
+        if self.__sample == SAMPLE_RANDOM:
+            lines = self.__random_sample(reader)
+        else:
+            lines = self.__every_kth(reader, self.__sample or 1)
+        for line in lines:
+            yield line.decode(errors='replace')
+
+    def __every_kth(self, reader, k):
         """
-        with open(self.__file_path, 'r') as file:
-            read_lines = file.readlines()
-            if self.__keyword == '':
-                for line in read_lines[-1:-(self.__num_lines+1):-1]:
-                    yield line
-            else:
-                cntr = 0
-                for line in reversed(read_lines):
-                    if cntr == self.__num_lines:
-                        break
-                    if self.__keyword in line:
-                        yield line
-                        cntr += 1
+        Generator to select every k-th matching line, newest-first, until num_lines lines are selected.
 
+        Args:
+        - reader (ReverseLineReader): The reader yielding the matching lines.
+        - k (int): The sampling interval (1 selects every matching line).
 
-    def __read_large_file(self):
+        Yields:
+        - bytes: The selected log lines.
         """
-        Read a large log file (load chunks into memory) and filter lines based on the keyword.
+        matches = 0
+        cntr = 0
+        if self.__num_lines > 0:
+            for _, line in reader:
+                if matches % k == 0:
+                    yield line
+                    cntr += 1
+                matches += 1
+                if cntr == self.__num_lines:
+                    break
+        self.__update_stats(reader, matches, cntr == self.__num_lines)
+
+    def __random_sample(self, reader):
         """
-        with open(self.__file_path, 'rb') as file:
-            file.seek(0, os.SEEK_END)
-            buffer = b''
-            position = file.tell()
+        Select a uniform random sample of num_lines matching lines (reservoir sampling) within the budget.
 
-            while position > 0 and len(self.__lines) < self.__num_lines:
-                position = max(0, position - BUFFER_SIZE)
-                file.seek(position)
-                buffer = file.read(BUFFER_SIZE) + buffer
-                cur_lines = buffer.split(b'\n')
-                buffer = cur_lines.pop(0)  # Keep the last partial line for the next read
+        Args:
+        - reader (ReverseLineReader): The reader yielding the matching lines.
 
-                for line in reversed(cur_lines):
-                    if len(line) > 0 and self.__keyword.encode() in line:
-                        self.__lines.append(f"{line.decode().strip()}\n")
-                        if len(self.__lines) == self.__num_lines:
-                            break
+        Returns:
+        - list: The selected log lines (bytes), newest-first.
+        """
+        reservoir = []
+        matches = 0
+        if self.__num_lines > 0:
+            for _, line in reader:
+                if matches < self.__num_lines:
+                    reservoir.append((matches, line))
+                else:
+                    index = random.randrange(matches + 1)
+                    if index < self.__num_lines:
+                        reservoir[index] = (matches, line)
+                matches += 1
+        self.__update_stats(reader, matches, self.__num_lines == 0)
+        reservoir.sort(key=lambda entry: entry[0])
+        return [line for _, line in reservoir]
+
+    def __update_stats(self, reader, matches, found_all):
+        """
+        Record how much of the file was scanned and estimate the total number of matching lines.
 
+        Args:
+        - reader (ReverseLineReader): The reader used for the scan.
+        - matches (int): The number of matching lines seen during the scan.
+        - found_all (bool): True if the result is complete without scanning the rest of the file (num_lines lines were selected).
+        """
+        if self.__num_lines == 0:
+            estimated_matches = None  # Nothing was scanned, the number of matches is unknown
+        elif reader.complete:
+            estimated_matches = matches
+        else:
+            # Extrapolate from the part of the file the matches were counted in
+            counted_bytes = reader.bytes_scanned
+            if found_all and reader.offset is not None:
+                counted_bytes = reader.bytes_total - reader.offset
+            estimated_matches = matches
+            if counted_bytes > 0:
+                estimated_matches = round(matches * reader.bytes_total / counted_bytes)
+        self.__stats = {
+            'bytes_scanned': reader.bytes_scanned,
+            'estimated_matches': estimated_matches,
+            'complete': reader.complete or found_all
+        }
+
+    def __buffer_size(self):
+        """
+        Get the read size for the log file: the whole file if it is small, BUFFER_SIZE chunks otherwise.
 
-    def __read_large_file_generator(self):
+        Returns:
+        - int: Number of bytes loaded into memory per read.
         """
-        Generator (used for streaming) to read a large log file (load chunks into memory) and filter lines based on the keyword.
-
-        Yields:
-        - str: The filtered log lines.
-        """
-        with open(self.__file_path, 'rb') as file:
-            file.seek(0, os.SEEK_END)
-            buffer = b''
-            position = file.tell()
-            cntr = 0
-
-            while position > 0 and cntr < self.__num_lines:
-                position = max(0, position - BUFFER_SIZE)
-                file.seek(position)
-                buffer = file.read(BUFFER_SIZE) + buffer
-                cur_lines = buffer.split(b'\n')
-                buffer = cur_lines.pop(0)  # Keep the last partial line for the next read
-
-                for line in reversed(cur_lines):
-                    if len(line) > 0 and self.__keyword.encode() in line:
-                        yield line.decode().strip()
-                        cntr += 1
-                        if cntr == self.__num_lines:
-                            break
+        file_size = os.path.getsize(self.__file_path)
+        if file_size <= SMALL_FILE_SIZE_LIMIT:
+            return max(file_size, 1)
+        return BUFFER_SIZE
 
     def get_lines(self):
         """
         Get the filtered log lines.
 
         Returns:
-        - list: The filtered log lines.
+        - deque: The filtered log lines (each ending with a newline).
         """
-        file_size = os.path.getsize(self.__file_path)
-        if file_size <= SMALL_FILE_SIZE_LIMIT:
-            self.__read_small_file()
-        else:
-            self.__read_large_file()
+        self.__lines.extend(f"{line}\n" for line in self.__read_lines_generator(self.__buffer_size()))
         return self.__lines
 
     def get_lines_generator(self):
@@ -152,10 +190,16 @@ class LogViewer:
         Get the filtered log lines as a generator.
 
         Returns:
-        - generator: The filtered log lines.
+        - generator: The filtered log lines (without line terminator).
         """
-        file_size = os.path.getsize(self.__file_path)
-        if file_size <= SMALL_FILE_SIZE_LIMIT:
-            return self.__read_small_file_generator()
-        else:
-            return self.__read_large_file_generator()
+        return self.__read_lines_generator(self.__buffer_size())
+
+    def get_stats(self):
+        """
+        Get the statistics of the last scan (available once the lines were read).
+
+        Returns:
+        - dict: bytes_scanned (int), estimated_matches (int, exact when the whole file was scanned, None when nothing was scanned) and
+          complete (bool, False when the budget ran out before the result was complete).
+        """
+        return self.__stats
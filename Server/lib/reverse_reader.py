@@ -0,0 +1,185 @@
+import os
+import time
+
+# Constants
+READ_BUFFER_SIZE = 500 * 1024  # 500 KB
+""" READ_BUFFER_SIZE (500KB default) is the size of each chunk read backwards from the file """
+PARTIAL_LINE_INCLUDE = 'include'
+""" PARTIAL_LINE_INCLUDE yields a final line without a line terminator like any other line """
+PARTIAL_LINE_SKIP = 'skip'
+""" PARTIAL_LINE_SKIP ignores a final line without a line terminator (it may still be being written) """
+PARTIAL_LINE_POLICIES = (PARTIAL_LINE_INCLUDE, PARTIAL_LINE_SKIP)
+
+
+class ReverseLineReader:
+    def __init__(self, source, start_offset=None, predicate=None, buffer_size=READ_BUFFER_SIZE,
+                 max_line_length=None, partial_line=PARTIAL_LINE_INCLUDE, max_bytes=None, deadline=None):
+        """
+        Initialize the ReverseLineReader instance.
+
+        Iterating the reader lazily yields the lines of a file newest-first as
+        (offset, line) tuples, where offset is the byte position of the first
+        byte of the line and line is the raw bytes without the line terminator
+        (either LF or CRLF). Only one chunk of buffer_size bytes plus the line
+        being assembled (at most max_line_length bytes) is held in memory at a
+        time, and lines spanning several chunks are joined once, so very long
+        lines are read in linear time.
+
+        Args:
+        - source (str | os.PathLike | file object): Path to the file, or a seekable file object opened in binary mode.
+        - start_offset (int): Byte offset to scan backwards from (exclusive). Pass the offset of the last line of a previous page to resume after it (optional, default: end of file).
+        - predicate (callable): Function called with each line (bytes), only lines for which it returns True are yielded (optional, default: every line).
+        - buffer_size (int): Number of bytes read per step (optional, default: READ_BUFFER_SIZE).
+        - max_line_length (int): Lines longer than this are truncated to their first max_line_length bytes before the predicate is applied (optional, default: no limit).
+        - partial_line (str): What to do with a final line that has no line terminator yet, one of PARTIAL_LINE_POLICIES (optional, default: PARTIAL_LINE_INCLUDE).
+        - max_bytes (int): Stop the scan once this many bytes were read (optional, default: no limit).
+        - deadline (float): Stop the scan once time.monotonic() reaches this value, checked before each read after the first one (optional, default: no limit).
+        """
+        if buffer_size <= 0:
+            raise ValueError('buffer_size must be a positive number')
+        if start_offset is not None and start_offset < 0:
+            raise ValueError('start_offset must not be negative')
+        if max_line_length is not None and max_line_length <= 0:
+            raise ValueError('max_line_length must be a positive number')
+        if partial_line not in PARTIAL_LINE_POLICIES:
+            raise ValueError(f"partial_line must be one of {', '.join(PARTIAL_LINE_POLICIES)}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError('max_bytes must be a positive number')
+        self.__source = source
+        self.__start_offset = start_offset
+        self.__predicate = predicate
+        self.__buffer_size = buffer_size
+        self.__max_line_length = max_line_length
+        self.__partial_line = partial_line
+        self.__max_bytes = max_bytes
+        self.__deadline = deadline
+        self.offset = start_offset
+        """ offset is the byte offset of the last yielded line, pass it as start_offset to resume the scan """
+        self.bytes_total = 0
+        """ bytes_total is the number of bytes between the start of the file and the offset the scan started from """
+        self.bytes_scanned = 0
+        """ bytes_scanned is the number of bytes read so far """
+        self.complete = False
+        """ complete is True once the scan reached the start of the file """
+
+    def __iter__(self):
+        """
+        Iterate over the lines of the file newest-first.
+
+        Yields:
+        - tuple: (offset, line) for every line accepted by the predicate.
+        """
+        if isinstance(self.__source, (str, bytes, os.PathLike)):
+            with open(self.__source, 'rb') as file:
+                yield from self.__read_lines(file)
+        else:
+            yield from self.__read_lines(self.__source)
+
+    def __read_lines(self, file):
+        """
+        Read the file backwards chunk by chunk and split it into lines.
+
+        Args:
+        - file (file object): A seekable file object opened in binary mode.
+
+        Yields:
+        - tuple: (offset, line) for every line accepted by the predicate.
+        """
+        file.seek(0, os.SEEK_END)
+        file_end = file.tell()
+        position = file_end
+        if self.__start_offset is not None:
+            position = min(position, self.__start_offset)
+        self.bytes_total = position
+        self.bytes_scanned = 0
+        self.complete = False
+
+        predicate = self.__predicate
+        max_length = self.__max_line_length
+        max_bytes = self.__max_bytes
+        deadline = self.__deadline
+        # The text after the last newline is not a line when it is empty, and may be skipped when it is
+        # a partial line at the end of the file
+        skip_first = self.__partial_line == PARTIAL_LINE_SKIP and position == file_end
+        first = True
+        end = position  # Offset just past the line currently being assembled (before its newline)
+        pending = []  # Fragments (newest first) of the line whose start is not found yet
+        pending_size = 0
+
+        while position > 0:
+            if self.bytes_scanned > 0 and (
+                    (max_bytes is not None and self.bytes_scanned >= max_bytes) or
+                    (deadline is not None and time.monotonic() >= deadline)):
+                return  # Budget exhausted, the line whose start is not found yet is dropped
+            read_size = min(self.__buffer_size, position)
+            if max_bytes is not None:
+                read_size = min(read_size, max_bytes - self.bytes_scanned)
+            position -= read_size
+            file.seek(position)
+            chunk = file.read(read_size)
+            self.bytes_scanned += read_size
+            cur_lines = chunk.split(b'\n')
+            if len(cur_lines) == 1:
+                pending_size += read_size
+                if max_length is None or pending_size <= max_length:
+                    pending.append(chunk)
+                continue
+
+            # The last piece of the chunk is the start of the line assembled from the previous reads
+            head = cur_lines.pop()
+            pending.append(head)
+            pending_size += len(head)
+            offset = end - pending_size
+            if not (first and (pending_size == 0 or skip_first)):
+                line = self.__join_line(file, offset, pending, pending_size)
+                if predicate is None or predicate(line):
+                    self.offset = offset
+                    yield offset, line
+            first = False
+            end = offset - 1
+
+            pending = [cur_lines[0]]  # Keep the first partial line for the next read
+            pending_size = len(cur_lines[0])
+            crlf = b'\r' in chunk
+            truncate = max_length is not None and read_size > max_length
+
+            for line in cur_lines[:0:-1]:
+                offset = end - len(line)
+                end = offset - 1
+                if crlf and line.endswith(b'\r'):
+                    line = line[:-1]
+                if truncate and len(line) > max_length:
+                    line = line[:max_length]
+                if predicate is None or predicate(line):
+                    self.offset = offset
+                    yield offset, line
+
+        if not (first and (pending_size == 0 or skip_first)):
+            line = self.__join_line(file, 0, pending, pending_size)
+            if predicate is None or predicate(line):
+                self.offset = 0
+                yield 0, line
+        self.complete = True
+
+    def __join_line(self, file, offset, pending, size):
+        """
+        Join the fragments of a line that spans several reads, truncating it to max_line_length.
+
+        Args:
+        - file (file object): The file being read, used to re-read the start of a truncated line.
+        - offset (int): The byte offset of the line.
+        - pending (list): The fragments of the line, newest first.
+        - size (int): The total size of the line in bytes.
+
+        Returns:
+        - bytes: The line without the line terminator.
+        """
+        max_length = self.__max_line_length
+        if max_length is not None and size > max_length:
+            # Only the end of the line was kept, read its start again
+            file.seek(offset)
+            return file.read(max_length)
+        line = b''.join(reversed(pending))
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        return line
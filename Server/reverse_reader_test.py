@@ -0,0 +1,139 @@
+import io
+import pytest
+from lib.reverse_reader import ReverseLineReader, PARTIAL_LINE_INCLUDE, PARTIAL_LINE_SKIP
+
+@pytest.fixture
+def log_file(tmp_path):
+    """
+    Fixture to create a small log file with 11 lines.
+
+    Returns:
+    - pathlib.Path: Path to the log file.
+    """
+    path = tmp_path / 'reader.log'
+    path.write_bytes(b''.join(f'Line {i}\n'.encode() for i in range(1, 12)))
+    return path
+
+def test_reverse_lines(log_file):
+    """
+    Test to verify that the reader yields every line newest-first for any buffer size.
+
+    Assertions:
+    - Lines should be in reverse order without line terminators.
+    """
+    expected = [f'Line {i}'.encode() for i in range(11, 0, -1)]
+    for buffer_size in (1, 3, 7, 1024):
+        lines = [line for _, line in ReverseLineReader(log_file, buffer_size=buffer_size)]
+        assert lines == expected
+
+def test_reverse_offsets(log_file):
+    """
+    Test to verify that the reader reports the byte offset of each line.
+
+    Assertions:
+    - Each offset should point at the first byte of its line.
+    """
+    data = log_file.read_bytes()
+    for offset, line in ReverseLineReader(log_file, buffer_size=4):
+        assert data[offset:offset + len(line)] == line
+        assert offset == 0 or data[offset - 1:offset] == b'\n'
+
+def test_resume_from_offset(log_file):
+    """
+    Test to verify that a scan can resume where the previous page ended.
+
+    Steps:
+    1. Read the first page of 4 lines.
+    2. Resume from the reader offset and read the rest.
+
+    Assertions:
+    - Both pages together should contain every line exactly once.
+    """
+    reader = ReverseLineReader(log_file, buffer_size=5)
+    first_page = []
+    for _, line in reader:
+        first_page.append(line)
+        if len(first_page) == 4:
+            break
+    second_page = [line for _, line in ReverseLineReader(log_file, start_offset=reader.offset, buffer_size=5)]
+    assert first_page + second_page == [f'Line {i}'.encode() for i in range(11, 0, -1)]
+
+def test_predicate_and_file_object():
+    """
+    Test to verify that the reader accepts a file object and filters lines with a predicate.
+
+    Assertions:
+    - Only the lines accepted by the predicate should be yielded, newest-first.
+    """
+    source = io.BytesIO(b'INFO a\nERROR b\nINFO c\nERROR d')
+    reader = ReverseLineReader(source, predicate=lambda line: b'ERROR' in line, buffer_size=2)
+    assert list(reader) == [(22, b'ERROR d'), (7, b'ERROR b')]
+
+def test_empty_lines_are_kept():
+    """
+    Test to verify that empty lines inside the file are yielded and a missing final newline is handled.
+
+    Assertions:
+    - Empty lines should be kept, the text after the last newline is a line only when not empty.
+    """
+    assert [line for _, line in ReverseLineReader(io.BytesIO(b'a\n\nb\n'))] == [b'b', b'', b'a']
+    assert [line for _, line in ReverseLineReader(io.BytesIO(b'a\n\nb'))] == [b'b', b'', b'a']
+    assert list(ReverseLineReader(io.BytesIO(b''))) == []
+
+def test_crlf_and_whitespace():
+    """
+    Test to verify that CRLF terminators are removed while other whitespace is kept, across chunk boundaries.
+
+    Assertions:
+    - Lines should match for every buffer size, with leading and trailing spaces preserved.
+    """
+    data = b'  first \r\nsecond\t\r\n\r\nthird\r\n'
+    for buffer_size in (1, 2, 3, 5, 64):
+        lines = [line for _, line in ReverseLineReader(io.BytesIO(data), buffer_size=buffer_size)]
+        assert lines == [b'third', b'', b'second\t', b'  first ']
+
+def test_long_lines_and_truncation():
+    """
+    Test to verify that lines longer than the buffer are joined and truncated to max_line_length.
+
+    Assertions:
+    - Long lines should be complete without a limit, and cut to their first max_line_length bytes with one.
+    - Offsets should be unaffected by the truncation.
+    """
+    long_line = b''.join(b'%07d' % i for i in range(1000))
+    data = b'short\n' + long_line + b'\r\nend\n'
+    assert list(ReverseLineReader(io.BytesIO(data), buffer_size=64)) == [(7008, b'end'), (6, long_line), (0, b'short')]
+    for buffer_size in (64, 10000):
+        reader = ReverseLineReader(io.BytesIO(data), buffer_size=buffer_size, max_line_length=10)
+        assert list(reader) == [(7008, b'end'), (6, long_line[:10]), (0, b'short')]
+
+def test_partial_line_policy():
+    """
+    Test to verify the policies for a final line without a line terminator.
+
+    Assertions:
+    - The partial line should be yielded with PARTIAL_LINE_INCLUDE and skipped with PARTIAL_LINE_SKIP.
+    - Resuming from an offset should not treat the line before it as partial.
+    """
+    data = b'a\nb\nhalf-writ'
+    assert [line for _, line in ReverseLineReader(io.BytesIO(data), partial_line=PARTIAL_LINE_INCLUDE)] == [b'half-writ', b'b', b'a']
+    assert [line for _, line in ReverseLineReader(io.BytesIO(data), partial_line=PARTIAL_LINE_SKIP)] == [b'b', b'a']
+    assert [line for _, line in ReverseLineReader(io.BytesIO(b'a\nb\n'), partial_line=PARTIAL_LINE_SKIP)] == [b'b', b'a']
+    assert [line for _, line in ReverseLineReader(io.BytesIO(data), start_offset=4, partial_line=PARTIAL_LINE_SKIP)] == [b'b', b'a']
+    with pytest.raises(ValueError):
+        ReverseLineReader(io.BytesIO(data), partial_line='wait')
+
+def test_byte_budget(log_file):
+    """
+    Test to verify that the scan stops once max_bytes bytes were read and reports its progress.
+
+    Assertions:
+    - Only the lines completely read within the budget should be yielded.
+    - bytes_scanned, bytes_total and complete should describe the scan.
+    """
+    reader = ReverseLineReader(log_file, buffer_size=4, max_bytes=17)
+    assert [line for _, line in reader] == [b'Line 11', b'Line 10']
+    assert (reader.bytes_scanned, reader.bytes_total, reader.complete) == (17, 79, False)
+    reader = ReverseLineReader(log_file, buffer_size=4)
+    assert len(list(reader)) == 11
+    assert (reader.bytes_scanned, reader.bytes_total, reader.complete) == (79, 79, True)